@@ -1,37 +1,75 @@
 import os
 import sys
 import argparse
+import contextlib
+import functools
+import math
+import mmap
+import re
 import subprocess
 import shutil
+import struct
 import zipfile
-from pathlib import Path
-from typing import Set, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import BinaryIO, Callable, Dict, Optional, List, Tuple, Iterator
 import py7zr
 
+try:
+    # zlib-ng's crc32 is PCLMULQDQ/PMULL accelerated; it is API compatible with zlib
+    from zlib_ng import zlib_ng as zlib
+except ImportError:
+    import zlib
+
+try:
+    # Optional live progress bar while archives are being tested
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
 def is_7z_available() -> bool:
     """Check if 7z command is available on the system."""
-    return shutil.which('7z') is not None or shutil.which('7z.exe') is not None
+    return get_7z_command() is not None
 
+@functools.lru_cache(maxsize=1)
 def get_7z_command() -> Optional[str]:
-    """Get the 7z command name for the current platform."""
+    """Get the 7z command name for the current platform.
+
+    The PATH lookup is done once per process; call get_7z_command.cache_clear()
+    to look again.
+    """
     if shutil.which('7z'):
         return '7z'
     elif shutil.which('7z.exe'):
         return '7z.exe'
     return None
 
+# Absolute path of the 7z executable, resolved once per pool worker process
+# (never set in the main process)
+_seven_zip_path: Optional[str] = None
+
+def init_worker() -> None:
+    """Prepare a worker to test many archives, resolving the 7z executable only once."""
+    global _seven_zip_path
+    cmd = get_7z_command()
+    _seven_zip_path = shutil.which(cmd) if cmd else None
+
 def test_archive_with_7z(archive_path: str) -> bool:
     """Test archive integrity using 7z command-line tool."""
-    cmd = get_7z_command()
+    cmd = _seven_zip_path or get_7z_command()
     if not cmd:
         return False
 
     try:
         # Run 7z test command (works for both 7z and zip formats)
+        # Only the exit code is used, so 7z's output and progress are switched
+        # off at the source (-bso0 -bsp0) and discarded
         result = subprocess.run(
-            [cmd, 't', archive_path],
-            capture_output=True,
-            text=True,
+            [cmd, 't', archive_path, '-bso0', '-bsp0'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=300  # 5 minute timeout
         )
         # 7z returns 0 on success
@@ -43,123 +81,530 @@ def test_archive_with_7z(archive_path: str) -> bool:
         print(f"Error running 7z command: {e}", file=sys.stderr)
         return False
 
-def find_archives(directory: str) -> Set[str]:
-    """Find all unique archives (7z and ZIP), including split/multi-volume archives."""
-    archives = set()
-    seen_split_bases = set()
-
-    # Search for 7z archives
-    for file in Path(directory).rglob('*.7z*'):
-        file_str = str(file)
-
-        # Check if this is a split volume (e.g., n.7z.001, n.7z.002)
-        if '.7z.' in file_str:
-            # Extract base name (e.g., "n.7z" from "n.7z.001")
-            base_name = file_str.rsplit('.', 1)[0]
-
-            # Only test the first volume (.001) of split archives
-            # Skip subsequent volumes (.002, .003, etc.)
-            if file_str.endswith('.001'):
-                archives.add(file_str)
-                seen_split_bases.add(base_name)
-            # Otherwise skip this volume (we already have the first one)
-        else:
-            # Regular archive (e.g., a.7z), use it directly
-            archives.add(file_str)
+# Number of archives passed to a single 7z invocation by test_archives_with_7z
+SEVEN_ZIP_BATCH_SIZE = 16
 
-    # Search for ZIP archives
-    for file in Path(directory).rglob('*.zip'):
-        archives.add(str(file))
+def split_into_batches(archive_paths: List[str], jobs: int) -> List[List[str]]:
+    """Split archives into batches for 7z, at most SEVEN_ZIP_BATCH_SIZE each.
 
-    # Search for multi-volume ZIP archives (.z01, .z02, etc.)
-    # Multi-volume ZIPs end with .z01, .z02, ..., .zip (the last part)
-    for file in Path(directory).rglob('*.z[0-9][0-9]'):
-        file_str = str(file)
-        # Extract base name without extension
-        base_name = file_str.rsplit('.z', 1)[0]
-
-        # Only add if we haven't seen this base before
-        # We'll test using the .zip file (last volume) if it exists
-        if base_name not in seen_split_bases:
-            # Look for the final .zip file for this multi-volume set
-            zip_file = base_name + '.zip'
-            if os.path.exists(zip_file):
-                archives.add(zip_file)
-                seen_split_bases.add(base_name)
+    Batches are made small enough that every one of the jobs workers gets one.
+    """
+    if not archive_paths:
+        return []
+    size = min(SEVEN_ZIP_BATCH_SIZE, math.ceil(len(archive_paths) / max(jobs, 1)))
+    return [archive_paths[i:i + size] for i in range(0, len(archive_paths), size)]
+
+# An error or warning line in 7z output, e.g. "ERROR: Data Error : a.txt",
+# "Open WARNING: ..." or "WARNINGS:"
+SEVEN_ZIP_PROBLEM_RE = re.compile(r'^\s*(?:Open\s+)?(?:ERRORS?|WARNINGS?)\b', re.MULTILINE)
+
+def parse_7z_batch_output(stdout: str) -> Dict[str, bool]:
+    """Read per-archive results from the output of a multi-archive "7z t" run.
+
+    Returns a mapping of normalized archive path to whether it passed. As with
+    a single-archive run, where any non-zero exit code fails, an archive only
+    passes if its section says "Everything is Ok" and has no error or warning.
+    """
+    sections = {}
+    for section in stdout.split('Testing archive: ')[1:]:
+        path, _, body = section.partition('\n')
+        sections[os.path.normpath(path.strip())] = \
+            'Everything is Ok' in body and not SEVEN_ZIP_PROBLEM_RE.search(body)
+    return sections
+
+def test_archives_with_7z(archive_paths: List[str]) -> Dict[str, bool]:
+    """Test several archives with one 7z invocation, amortizing its startup cost.
+
+    Each archive's result is read from its "Testing archive:" section of the
+    7z output. Archives whose section cannot be found are tested on their own.
+    """
+    cmd = _seven_zip_path or get_7z_command()
+    if not cmd:
+        return {archive_path: False for archive_path in archive_paths}
+
+    # 7z treats -ai! arguments as wildcards, so names containing them go on their own
+    batch = [p for p in archive_paths if not any(c in p for c in '*?')]
+    results = {}
+
+    if len(batch) > 1:
+        try:
+            # -an: no positional archive name; -ai!: include each archive by name
+            # stdout is parsed for per-archive results; progress is turned off
+            # (-bsp0) and error messages are sent to stdout (-bse1) so that
+            # they land in the section of the archive they belong to
+            result = subprocess.run(
+                [cmd, 't', '-an', '-bsp0', '-bse1', *(f'-ai!{p}' for p in batch)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=300 * len(batch)  # 5 minutes per archive
+            )
+            if result.returncode == 0:
+                results = {archive_path: True for archive_path in batch}
             else:
-                # If no .zip file exists, use the first volume (.z01)
-                first_volume = base_name + '.z01'
-                if os.path.exists(first_volume):
-                    archives.add(first_volume)
-                    seen_split_bases.add(base_name)
+                sections = parse_7z_batch_output(result.stdout)
+                for archive_path in batch:
+                    ok = sections.get(os.path.normpath(archive_path))
+                    if ok is not None:
+                        results[archive_path] = ok
+        except subprocess.TimeoutExpired:
+            print("Timeout testing archives with 7z", file=sys.stderr)
+        except Exception as e:
+            print(f"Error running 7z command: {e}", file=sys.stderr)
 
-    return archives
+    for archive_path in archive_paths:
+        if archive_path not in results:
+            results[archive_path] = test_archive_with_7z(archive_path)
+    return results
 
-def test_archive(archive_path: str) -> bool:
-    """Test archive integrity. Supports 7z, ZIP, and multi-volume archives."""
-    archive_lower = archive_path.lower()
-
-    # Detect multi-volume archives (need 7z command)
-    is_multivolume_7z = '.7z.' in archive_lower and archive_lower.endswith('.001')
-
-    # Check for multi-volume ZIP by looking for .z01, .z02, etc. files
-    is_multivolume_zip = False
-    if archive_lower.endswith('.zip') or archive_lower.endswith('.z01'):
-        # Check if any .z01, .z02, etc. files exist
-        base_path = archive_path.replace('.zip', '').replace('.z01', '')
-        for i in range(1, 100):
-            if os.path.exists(f'{base_path}.z{i:02d}'):
-                is_multivolume_zip = True
-                break
-
-    # For multi-volume archives, try 7z command first
-    if is_multivolume_7z or is_multivolume_zip:
-        if is_7z_available():
-            return test_archive_with_7z(archive_path)
-        else:
-            print(f"Warning: Multi-volume archive detected but 7z command not available",
-                  file=sys.stderr)
-            print(f"Install 7-Zip to test multi-volume archives", file=sys.stderr)
-            return False
+# Read size for streaming ZIP entries; large enough to amortize per-call overhead
+CRC_CHUNK_SIZE = 1 << 20
+
+# Fixed part of a ZIP local file header, followed by the file name and extra field
+ZIP_LOCAL_HEADER = struct.Struct('<4s22xHH')
+ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+def verify_zip_entry_in_place(view: memoryview, info: zipfile.ZipInfo) -> Optional[bool]:
+    """Check one entry's CRC directly from the mapped archive bytes.
+
+    Stored entries are CRC'd without copying, and deflated entries are
+    inflated and CRC'd in a single pass. Returns None for entries this
+    cannot handle (encrypted, other compression methods, unusual headers),
+    which should then be checked through zipfile.
+    """
+    if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED,
+                                                           zipfile.ZIP_DEFLATED):
+        return None
+
+    header_end = info.header_offset + ZIP_LOCAL_HEADER.size
+    if header_end > len(view):
+        return None
+    signature, name_length, extra_length = ZIP_LOCAL_HEADER.unpack(
+        view[info.header_offset:header_end])
+    if signature != ZIP_LOCAL_HEADER_SIGNATURE:
+        return None
+    start = header_end + name_length + extra_length
+    end = start + info.compress_size
+    if end > len(view):
+        return None
+
+    if info.compress_type == zipfile.ZIP_STORED:
+        return info.compress_size == info.file_size and \
+            zlib.crc32(view[start:end]) == info.CRC
 
-    # Test regular ZIP files with zipfile module
-    if archive_lower.endswith('.zip'):
+    crc = 0
+    size = 0
+    inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+    try:
+        for offset in range(start, end, CRC_CHUNK_SIZE):
+            data = view[offset:min(offset + CRC_CHUNK_SIZE, end)]
+            while data:
+                # Bound each output chunk so highly compressed entries can't balloon memory
+                chunk = inflater.decompress(data, CRC_CHUNK_SIZE)
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                data = inflater.unconsumed_tail
+        chunk = inflater.flush()
+    except zlib.error:
+        return False
+    crc = zlib.crc32(chunk, crc)
+    size += len(chunk)
+    return inflater.eof and size == info.file_size and crc == info.CRC
+
+def verify_zip_crcs(zf: zipfile.ZipFile, mm: Optional[mmap.mmap] = None) -> bool:
+    """Check every entry of an open ZIP against its stored CRC.
+
+    If the archive is memory-mapped, entries are checked in place where possible
+    (see verify_zip_entry_in_place). The remaining entries, or all of them when
+    mm is None, are read through zipfile exactly as ZipFile.testzip() does; this
+    fallback only exists to check that subset and is not an optimisation.
+    """
+    if mm is not None:
+        with memoryview(mm) as view:
+            pending = []
+            for info in zf.infolist():
+                ok = verify_zip_entry_in_place(view, info)
+                if ok is False:
+                    return False
+                if ok is None:
+                    pending.append(info)
+    else:
+        pending = zf.infolist()
+
+    try:
+        for info in pending:
+            # Same as ZipFile.testzip(): ZipExtFile checks the CRC and raises at EOF
+            with zf.open(info) as f:
+                while f.read(CRC_CHUNK_SIZE):
+                    pass
+    except zipfile.BadZipFile:
+        return False
+    return True
+
+SEVEN_ZIP_SIGNATURE = b'7z\xbc\xaf\x27\x1c'
+
+def has_7z_signature(f: BinaryIO) -> bool:
+    """Check that an open file starts with the 7z signature, without parsing the header."""
+    f.seek(0)
+    signature = f.read(len(SEVEN_ZIP_SIGNATURE))
+    f.seek(0)
+    return signature == SEVEN_ZIP_SIGNATURE
+
+# Buffer size for archive files; lets the decompressors' many small reads hit memory
+ARCHIVE_BUFFER_SIZE = 1 << 20
+
+def open_archive_file(archive_path: str) -> BinaryIO:
+    """Open an archive for a sequential integrity scan with large, read-ahead buffered I/O."""
+    f = open(archive_path, 'rb', buffering=ARCHIVE_BUFFER_SIZE)
+    if hasattr(os, 'posix_fadvise'):
         try:
-            with zipfile.ZipFile(archive_path, 'r') as zf:
-                # testzip() returns None if OK, or name of first bad file
-                result = zf.testzip()
-                return result is None
-        except zipfile.BadZipFile:
-            # Try with 7z as fallback if available
-            if is_7z_available():
-                return test_archive_with_7z(archive_path)
+            # Ask the kernel for aggressive read-ahead on this file
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # The hint is optional; some files and filesystems reject it
+            pass
+    return f
+
+class MappedFile(mmap.mmap):
+    """Read-only memory map usable as a file object by zipfile."""
+
+    def seekable(self) -> bool:
+        # mmap only gained seekable() in Python 3.13
+        return True
+
+@contextlib.contextmanager
+def map_archive_file(archive_path: str) -> Iterator[Optional[MappedFile]]:
+    """Memory-map an archive read-only, so zipfile's seeks and reads avoid syscalls.
+
+    Yields None if the file cannot be mapped (e.g. it is empty, or on a
+    filesystem without mmap support). If the file shrinks while mapped,
+    touching the lost pages raises SIGBUS and kills the process; test_archives
+    retries such crashed tasks in isolation so only that archive fails.
+    """
+    with open(archive_path, 'rb') as f:
+        try:
+            mm = MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield None
+            return
+        with mm:
+            if hasattr(mm, 'madvise'):
+                # Entries are streamed front to back during the CRC check
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+def zip_entries_in_bounds(zf: zipfile.ZipFile, archive_size: int) -> bool:
+    """Check central directory offsets and sizes against the file size."""
+    for info in zf.infolist():
+        if info.header_offset + info.compress_size > archive_size:
             return False
-        except Exception as e:
-            print(f"Error testing ZIP archive: {e}", file=sys.stderr)
-            # Try with 7z as fallback if available
-            if is_7z_available():
-                return test_archive_with_7z(archive_path)
+    return True
+
+# Threads used to list directories in parallel; directory reads are I/O-wait dominated
+WALK_WORKERS = 8
+
+def scan_directory(directory: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """List one directory, returning its files as (name, path) and its subdirectories."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                # DirEntry type checks use the cached d_type, avoiding a stat per entry
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append((entry.name, entry.path))
+    except OSError:
+        # Skip unreadable directories, as Path.rglob does
+        pass
+    return files, subdirs
+
+def walk_files(directory: str, workers: int = WALK_WORKERS) -> Iterator[Tuple[str, str]]:
+    """Yield (name, path) for every file below directory, listing directories in parallel."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(scan_directory, directory)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                yield from files
+                pending |= {executor.submit(scan_directory, subdir) for subdir in subdirs}
+
+# Archive kinds returned by find_archives, with their display names
+ARCHIVE_TYPE_LABELS = {
+    '7z': '7z',
+    '7z-mv': '7z multi-volume',
+    'zip': 'ZIP',
+    'zip-mv': 'ZIP multi-volume',
+}
+
+def classify_archive_name(name: str) -> Optional[str]:
+    """Classify a file name by its extension alone.
+
+    Returns '7z', '7z-mv' (first volume of a split 7z), 'zip', 'zip-volume'
+    (a .zNN volume of a multi-volume ZIP) or None for other files.
+    """
+    root, ext = os.path.splitext(name)
+    ext = ext.lower()
+    if ext == '.zip':
+        return 'zip'
+    if ext == '.7z':
+        return '7z'
+    if ext == '.001' and root.lower().endswith('.7z'):
+        return '7z-mv'
+    if len(ext) == 4 and ext[1] == 'z' and ext[2:].isascii() and ext[2:].isdigit() \
+            and ext[2:] != '00':
+        return 'zip-volume'
+    return None
+
+def find_archives(directory: str) -> Dict[str, str]:
+    """Find all unique archives (7z and ZIP), including split/multi-volume archives.
+
+    Returns a mapping of archive path to kind ('7z', '7z-mv', 'zip' or 'zip-mv').
+    """
+    archives = {}
+    zip_files = {}
+    first_zip_volumes = {}
+    zip_volume_bases = set()
+
+    # Walk the tree once, classifying each file by its name
+    for name, path in walk_files(directory):
+        kind = classify_archive_name(name)
+        if kind is None:
+            continue
+        if kind == '7z-mv':
+            # Only the first volume (.001) of split archives is tested (e.g., n.7z.001)
+            archives[path] = '7z-mv'
+        elif kind == '7z':
+            archives[path] = '7z'
+        elif kind == 'zip':
+            archives[path] = 'zip'
+            zip_files[path[:-4].lower()] = path
+        else:
+            # Volume of a multi-volume ZIP (.z01, .z02, etc.)
+            base_name = path[:-4].lower()
+            zip_volume_bases.add(base_name)
+            if name[-2:] == '01':
+                first_zip_volumes[base_name] = path
+
+    # Multi-volume ZIPs end with .z01, .z02, ..., .zip (the last part)
+    # We'll test using the .zip file if it exists, otherwise the first volume (.z01)
+    for base_name in zip_volume_bases:
+        if base_name in zip_files:
+            archives[zip_files[base_name]] = 'zip-mv'
+        elif base_name in first_zip_volumes:
+            archives[first_zip_volumes[base_name]] = 'zip-mv'
+
+    return archives
+
+def has_zip_volumes(zip_path: str) -> bool:
+    """Check whether .z01, .z02, etc. volumes exist next to a ZIP file.
+
+    Lists the parent directory once instead of probing each volume name.
+    """
+    parent = os.path.dirname(zip_path) or '.'
+    base = os.path.basename(zip_path)[:-4].lower()
+    try:
+        with os.scandir(parent) as it:
+            # Matched case-insensitively, like find_archives
+            return any(classify_archive_name(entry.name) == 'zip-volume'
+                       and entry.name[:-4].lower() == base for entry in it)
+    except OSError:
+        return False
+
+def test_multivolume_archive(archive_path: str) -> bool:
+    """Test a multi-volume 7z or ZIP archive, which needs the 7z command."""
+    if is_7z_available():
+        return test_archive_with_7z(archive_path)
+    print(f"Warning: Multi-volume archive detected but 7z command not available",
+          file=sys.stderr)
+    print(f"Install 7-Zip to test multi-volume archives", file=sys.stderr)
+    return False
+
+def test_zip_archive(archive_path: str) -> bool:
+    """Test a ZIP archive with the zipfile module, or with 7z if it has volumes."""
+    if has_zip_volumes(archive_path):
+        return test_multivolume_archive(archive_path)
+    return test_single_volume_zip(archive_path)
+
+def check_zip_file(f: BinaryIO, archive_size: int, mm: Optional[mmap.mmap] = None) -> bool:
+    """Check an open ZIP file's central directory and entry CRCs."""
+    # Cheap end-of-central-directory check before decompressing anything
+    if not zipfile.is_zipfile(f):
+        return False
+    with zipfile.ZipFile(f, 'r') as zf:
+        if not zip_entries_in_bounds(zf, archive_size):
             return False
+        return verify_zip_crcs(zf, mm)
 
-    # Test 7z files with py7zr
-    if '.7z' in archive_lower:
-        try:
-            with py7zr.SevenZipFile(archive_path, 'r') as archive:
+def test_single_volume_zip(archive_path: str) -> bool:
+    """Test a ZIP archive known to have no .zNN volumes with the zipfile module."""
+    try:
+        with map_archive_file(archive_path) as mm:
+            if mm is not None:
+                return check_zip_file(mm, len(mm), mm)
+        # The file could not be mapped, so read it through a buffered file instead
+        with open_archive_file(archive_path) as f:
+            return check_zip_file(f, os.fstat(f.fileno()).st_size)
+    except zipfile.BadZipFile:
+        # Try with 7z as fallback if available
+        if is_7z_available():
+            return test_archive_with_7z(archive_path)
+        return False
+    except Exception as e:
+        print(f"Error testing ZIP archive: {e}", file=sys.stderr)
+        # Try with 7z as fallback if available
+        if is_7z_available():
+            return test_archive_with_7z(archive_path)
+        return False
+
+def test_7z_archive(archive_path: str) -> bool:
+    """Test a single-volume 7z archive with py7zr."""
+    try:
+        with open_archive_file(archive_path) as f:
+            # Reject files with a wrong magic before py7zr parses the whole header
+            if not has_7z_signature(f):
+                return False
+            with py7zr.SevenZipFile(f, 'r') as archive:
                 # testzip() returns None if archive is OK, or name of first bad file
                 result = archive.testzip()
                 return result is None
-        except py7zr.exceptions.Bad7zFile:
-            # Invalid or corrupted 7z file
-            return False
-        except Exception as e:
-            # Handle other potential errors (permissions, file not found, etc.)
-            print(f"Error testing 7z archive: {e}", file=sys.stderr)
-            return False
+    except py7zr.exceptions.Bad7zFile:
+        # Invalid or corrupted 7z file
+        return False
+    except Exception as e:
+        # Handle other potential errors (permissions, file not found, etc.)
+        print(f"Error testing 7z archive: {e}", file=sys.stderr)
+        return False
 
-    # Unknown format
+def test_unknown_archive(archive_path: str) -> bool:
+    """Reject a file whose extension is not a supported archive format."""
     print(f"Warning: Unknown archive format: {archive_path}", file=sys.stderr)
     return False
 
+# Integrity test for each archive kind, as reported by find_archives or
+# classify_archive_name
+KIND_TESTERS = {
+    '7z': test_7z_archive,
+    '7z-mv': test_multivolume_archive,
+    'zip': test_single_volume_zip,
+    'zip-mv': test_multivolume_archive,
+    'zip-volume': test_multivolume_archive,
+}
+
+def get_archive_tester(archive_path: str) -> Callable[[str], bool]:
+    """Look up the integrity test for an archive from its file name alone."""
+    kind = classify_archive_name(os.path.basename(archive_path))
+    if kind == 'zip':
+        # Without a kind from find_archives, a .zip may still have .zNN volumes
+        return test_zip_archive
+    return KIND_TESTERS.get(kind, test_unknown_archive)
+
+def is_multivolume(archive_path: str, kind: Optional[str] = None) -> bool:
+    """Check whether an archive spans several volumes and so needs the 7z command."""
+    if kind is not None:
+        return KIND_TESTERS[kind] is test_multivolume_archive
+    tester = get_archive_tester(archive_path)
+    if tester is test_zip_archive:
+        return has_zip_volumes(archive_path)
+    return tester is test_multivolume_archive
+
+def test_archive(archive_path: str, kind: Optional[str] = None) -> bool:
+    """Test archive integrity. Supports 7z, ZIP, and multi-volume archives.
+
+    If kind is given (as returned by find_archives), the archive type is not
+    detected again.
+    """
+    if kind is not None:
+        return KIND_TESTERS[kind](archive_path)
+    return get_archive_tester(archive_path)(archive_path)
+
+def test_archive_group(archives: Dict[str, Optional[str]]) -> Dict[str, bool]:
+    """Test archives, given as a mapping of path to kind, one at a time."""
+    return {archive: test_archive(archive, kind) for archive, kind in archives.items()}
+
+def run_isolated(func: Callable, group) -> Dict[str, bool]:
+    """Run one task in a worker process of its own; a crash fails only its archives."""
+    with ProcessPoolExecutor(max_workers=1, initializer=init_worker) as executor:
+        try:
+            return executor.submit(func, group).result()
+        except Exception as e:
+            for archive in group:
+                print(f"Error testing archive {archive}: {e}", file=sys.stderr)
+            return {archive: False for archive in group}
+
+def iter_archive_results(archives: List[str], jobs: int = 1,
+                         kinds: Optional[Dict[str, str]] = None
+                         ) -> Iterator[Tuple[str, bool]]:
+    """Test several archives, in parallel when jobs > 1, yielding results as they finish.
+
+    kinds optionally maps archive paths to the kinds found by find_archives.
+    Multi-volume archives are handed to 7z in batches (see split_into_batches).
+    """
+    kinds = kinds or {}
+    batched = ([a for a in archives if is_multivolume(a, kinds.get(a))]
+               if is_7z_available() else [])
+    batched_set = set(batched)
+    tasks = [(test_archives_with_7z, batch) for batch in split_into_batches(batched, jobs)]
+    tasks += [(test_archive_group, {a: kinds.get(a)}) for a in archives if a not in batched_set]
+
+    if jobs <= 1 or len(tasks) <= 1:
+        # Sequential mode keeps output interleaving deterministic for debugging.
+        # init_worker() is only for pool workers, so the main process keeps
+        # honouring get_7z_command.cache_clear()
+        for func, group in tasks:
+            yield from func(group).items()
+        return
+
+    # Workers persist across archives, so interpreter startup and module imports
+    # are paid once per worker rather than once per archive
+    unfinished = []
+    executor = ProcessPoolExecutor(max_workers=min(jobs, len(tasks)), initializer=init_worker)
+    try:
+        futures = {executor.submit(func, group): (func, group) for func, group in tasks}
+        for future in as_completed(futures):
+            func, group = futures[future]
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                # A worker died (e.g. a native decompressor fault), which breaks the
+                # whole pool; we can't tell which task did it, so retry them all
+                unfinished.append((func, group))
+                continue
+            except Exception as e:
+                for archive in group:
+                    print(f"Error testing archive {archive}: {e}", file=sys.stderr)
+                results = {archive: False for archive in group}
+            yield from results.items()
+    finally:
+        # Don't start queued archives if the caller stops early (e.g. on Ctrl-C)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    # Retry each unfinished task in its own process, so a crash fails only its archives
+    for func, group in unfinished:
+        yield from run_isolated(func, group).items()
+
+def test_archives(archives: List[str], jobs: int = 1,
+                  kinds: Optional[Dict[str, str]] = None) -> List[Tuple[str, bool]]:
+    """Test several archives, in parallel when jobs > 1.
+
+    Results are returned in the order the archives were given, regardless
+    of the order in which the workers finish.
+    """
+    results = dict(iter_archive_results(archives, jobs, kinds))
+    return [(archive, results[archive]) for archive in archives]
+
+def show_progress(done: int, total: int) -> None:
+    """Show a done/total counter on stderr, used when tqdm is not installed."""
+    if sys.stderr.isatty():
+        # Redraw the counter in place on a terminal
+        end = '\n' if done == total else ''
+        sys.stderr.write(f"\rTested {done}/{total} archive(s){end}")
+    else:
+        sys.stderr.write(f"Tested {done}/{total} archive(s)\n")
+    sys.stderr.flush()
+
 def main():
     parser = argparse.ArgumentParser(
         description='Check integrity of archives (7z and ZIP) in a directory'
@@ -167,8 +612,13 @@ def main():
     parser.add_argument('directory', help='Directory to scan for archive files')
     parser.add_argument('--recursive', '-r', action='store_true',
                         help='Scan directory recursively (enabled by default)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of archives to test in parallel (default: CPU count)')
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     if not os.path.isdir(args.directory):
         print(f"Error: '{args.directory}' is not a valid directory")
         return 1
@@ -184,42 +634,61 @@ def main():
 
     results = {'passed': [], 'failed': []}
 
-    for archive in sorted(archives):
-        # Determine archive type for display
-        archive_lower = archive.lower()
-        if '.7z.' in archive_lower and archive_lower.endswith('.001'):
-            archive_type = "7z multi-volume"
-        elif archive_lower.endswith('.zip') and any(
-            os.path.exists(archive.replace('.zip', f'.z{i:02d}')) for i in range(1, 10)
-        ):
-            archive_type = "ZIP multi-volume"
-        elif archive_lower.endswith('.zip'):
-            archive_type = "ZIP"
-        elif '.7z' in archive_lower:
-            archive_type = "7z"
-        else:
-            archive_type = "unknown"
+    # Collect results as they finish, showing live progress on stderr
+    tested = {}
+    progress = None
+    if tqdm is not None:
+        # tqdm rate-limits its redraws, so updating it per archive is cheap
+        progress = tqdm(total=len(archives), unit='archive', file=sys.stderr, leave=False)
+    interrupted = False
+    results_iter = iter_archive_results(sorted(archives), args.jobs, archives)
+    try:
+        for archive, ok in results_iter:
+            tested[archive] = ok
+            if progress is not None:
+                progress.update(1)
+            else:
+                show_progress(len(tested), len(archives))
+    except KeyboardInterrupt:
+        # Still report the archives that finished before the interruption
+        interrupted = True
+        results_iter.close()
+        if progress is None:
+            sys.stderr.write('\n')
+    finally:
+        if progress is not None:
+            progress.close()
 
-        print(f"Testing [{archive_type}]: {archive}")
-        if test_archive(archive):
+    # Buffer the report and write it in one go once testing has finished
+    lines = []
+    for archive in sorted(tested):
+        ok = tested[archive]
+        lines.append(f"Testing [{ARCHIVE_TYPE_LABELS[archives[archive]]}]: {archive}")
+        if ok:
             results['passed'].append(archive)
-            print("✓ Archive is valid\n")
+            lines.append("✓ Archive is valid\n")
         else:
             results['failed'].append(archive)
-            print("✗ Archive is corrupted or invalid\n")
+            lines.append("✗ Archive is corrupted or invalid\n")
 
-    print("=" * 60)
-    print("Summary:")
-    print(f"  Passed: {len(results['passed'])}")
-    print(f"  Failed: {len(results['failed'])}")
-    print("=" * 60)
+    lines.append("=" * 60)
+    lines.append("Summary:")
+    lines.append(f"  Passed: {len(results['passed'])}")
+    lines.append(f"  Failed: {len(results['failed'])}")
+    if interrupted:
+        lines.append(f"  Not tested (interrupted): {len(archives) - len(tested)}")
+    lines.append("=" * 60)
 
     if results['failed']:
-        print("\nFailed archives:")
+        lines.append("\nFailed archives:")
         for archive in results['failed']:
-            print(f"  - {archive}")
-        return 1
-    return 0
+            lines.append(f"  - {archive}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+    if interrupted:
+        return 130
+    return 1 if results['failed'] else 0
 
 if __name__ == '__main__':
     exit(main())
\ No newline at end of file
@@ -1,5 +1,9 @@
+import multiprocessing
 import os
+import signal
+import subprocess
 import sys
+import zipfile
 import pytest
 from pathlib import Path
 
@@ -67,6 +71,19 @@ class TestArchiveIntegrity:
         result = main.test_archive(str(archive_path))
         assert result is True, "Valid multi-volume ZIP archive should pass integrity check"
 
+    def test_7z_fadvise_rejected(self, monkeypatch):
+        """Test that a rejected read-ahead hint does not fail a valid 7z archive."""
+        if not hasattr(os, "posix_fadvise"):
+            pytest.skip("posix_fadvise not available on this platform")
+
+        def failing_fadvise(*args):
+            raise OSError(29, "Illegal seek")
+
+        monkeypatch.setattr(main.os, "posix_fadvise", failing_fadvise)
+
+        result = main.test_archive(str(FIXTURES_DIR / "valid_simple.7z"))
+        assert result is True, "Valid 7z archive should pass when fadvise is rejected"
+
     def test_corrupted_7z(self):
         """Test that a corrupted 7z archive fails integrity check."""
         archive_path = FIXTURES_DIR / "corrupted.7z"
@@ -117,6 +134,103 @@ class TestArchiveIntegrity:
         result = main.test_archive(str(archive_path))
         assert result is False, "Corrupted ZIP archive should fail integrity check"
 
+    def test_zip_crc_mismatch(self, tmp_path):
+        """Test that a ZIP whose entry data does not match its CRC fails integrity check."""
+        archive_path = tmp_path / "bad_crc.zip"
+        payload = b"integrity" * 1000
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr("data.bin", payload)
+
+        # Flip one byte of the stored entry data, leaving the headers intact
+        data = bytearray(archive_path.read_bytes())
+        offset = data.index(payload)
+        data[offset] ^= 0xFF
+        archive_path.write_bytes(bytes(data))
+
+        result = main.test_archive(str(archive_path))
+        assert result is False, "ZIP with a CRC mismatch should fail integrity check"
+
+        # The streaming check reports the mismatch itself rather than raising
+        with zipfile.ZipFile(archive_path) as zf:
+            assert main.verify_zip_crcs(zf) is False
+
+    def test_zip_in_place_crc_check(self, tmp_path):
+        """Test that stored and deflated entries are checked directly from the mapped file."""
+        archive_path = tmp_path / "mixed.zip"
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("stored.txt", b"stored" * 1000, compress_type=zipfile.ZIP_STORED)
+            zf.writestr("deflated.txt", b"deflated" * 100000, compress_type=zipfile.ZIP_DEFLATED)
+            zf.writestr("empty/", b"")
+
+        with zipfile.ZipFile(archive_path) as zf, main.map_archive_file(str(archive_path)) as mm:
+            with memoryview(mm) as view:
+                results = [main.verify_zip_entry_in_place(view, info) for info in zf.infolist()]
+
+        assert results == [True, True, True], "All entries should be checked in place"
+
+    def test_zip_in_place_crc_check_used(self, tmp_path, monkeypatch):
+        """Test that test_archive() checks mapped entries in place, not through zipfile."""
+        archive_path = tmp_path / "deflated.zip"
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a.txt", b"alpha" * 10000)
+            zf.writestr("b.txt", b"beta" * 10000)
+
+        in_place_calls = []
+        verify_in_place = main.verify_zip_entry_in_place
+
+        def recording_verify(view, info):
+            result = verify_in_place(view, info)
+            in_place_calls.append((info.filename, result))
+            return result
+
+        def failing_open(self, *args, **kwargs):
+            raise AssertionError("Entries should not be read through ZipFile.open")
+
+        monkeypatch.setattr(main, "verify_zip_entry_in_place", recording_verify)
+        monkeypatch.setattr(zipfile.ZipFile, "open", failing_open)
+
+        assert main.test_archive(str(archive_path)) is True
+        assert in_place_calls == [("a.txt", True), ("b.txt", True)]
+
+    def test_zip_unmappable(self, monkeypatch):
+        """Test that a ZIP that cannot be memory-mapped is checked through a regular file."""
+        def failing_map(*args, **kwargs):
+            raise OSError(19, "No such device")
+
+        monkeypatch.setattr(main, "MappedFile", failing_map)
+
+        assert main.test_archive(str(FIXTURES_DIR / "valid_simple.zip")) is True
+        assert main.test_archive(str(FIXTURES_DIR / "corrupted.zip")) is False
+
+    def test_truncated_zip(self, tmp_path):
+        """Test that a ZIP without its central directory fails integrity check."""
+        archive_path = tmp_path / "truncated.zip"
+        data = (FIXTURES_DIR / "valid_simple.zip").read_bytes()
+        archive_path.write_bytes(data[:len(data) // 2])
+
+        result = main.test_archive(str(archive_path))
+        assert result is False, "Truncated ZIP archive should fail integrity check"
+
+    def test_empty_zip(self, tmp_path):
+        """Test that an empty file with a .zip extension fails integrity check."""
+        archive_path = tmp_path / "empty.zip"
+        archive_path.write_bytes(b"")
+
+        result = main.test_archive(str(archive_path))
+        assert result is False, "Empty ZIP file should fail integrity check"
+
+    def test_7z_bad_signature(self, tmp_path):
+        """Test that a file with a .7z extension but no 7z signature fails integrity check."""
+        archive_path = tmp_path / "not_really.7z"
+        archive_path.write_bytes(b"this is not a 7z archive")
+
+        with open(FIXTURES_DIR / "valid_simple.7z", "rb") as f:
+            assert main.has_7z_signature(f) is True
+        with open(archive_path, "rb") as f:
+            assert main.has_7z_signature(f) is False
+        result = main.test_archive(str(archive_path))
+        assert result is False, "File without 7z signature should fail integrity check"
+
 
 class TestArchiveDiscovery:
     """Test suite for archive discovery functionality."""
@@ -151,6 +265,59 @@ class TestArchiveDiscovery:
         archives = main.find_archives(str(empty_dir))
         assert len(archives) == 0, "Should find no archives in empty directory"
 
+    def test_find_archives_nested_directories(self, tmp_path):
+        """Test that find_archives() descends into subdirectories and skips later volumes."""
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        for name in ["top.zip", "a/split.7z.001", "a/split.7z.002",
+                     "a/b/single.7z", "a/b/parts.z01", "a/b/parts.z02", "a/b/notes.txt"]:
+            (tmp_path / name).write_bytes(b"")
+
+        archives = main.find_archives(str(tmp_path))
+
+        expected = {str(tmp_path / name) for name in
+                    ["top.zip", "a/split.7z.001", "a/b/single.7z", "a/b/parts.z01"]}
+        assert set(archives) == expected, "Should find one entry per logical archive"
+
+    def test_find_archives_lists_each_directory_once(self, tmp_path, monkeypatch):
+        """Test that find_archives() discovers every archive type in a single tree walk."""
+        (tmp_path / "sub").mkdir()
+        for name in ["a.zip", "b.7z", "sub/c.7z.001", "sub/d.z01", "sub/readme.txt"]:
+            (tmp_path / name).write_bytes(b"")
+
+        scanned = []
+        scan_directory = main.scan_directory
+
+        def counting_scan(directory):
+            scanned.append(directory)
+            return scan_directory(directory)
+
+        monkeypatch.setattr(main, "scan_directory", counting_scan)
+        archives = main.find_archives(str(tmp_path))
+
+        assert len(archives) == 4, "Should find the ZIP, 7z and both split archives"
+        assert sorted(scanned) == [str(tmp_path), str(tmp_path / "sub")], \
+            "Each directory should be listed exactly once"
+
+    def test_find_archives_kinds(self):
+        """Test that find_archives() labels each archive with its kind."""
+        if not FIXTURES_DIR.exists():
+            pytest.skip(f"Fixtures directory not found: {FIXTURES_DIR}")
+
+        archives = main.find_archives(str(FIXTURES_DIR))
+        kinds = {Path(path).name: kind for path, kind in archives.items()}
+
+        assert kinds == {
+            "valid_simple.7z": "7z",
+            "corrupted.7z": "7z",
+            "valid_multi.7z.001": "7z-mv",
+            "corrupted_multi.7z.001": "7z-mv",
+            "valid_simple.zip": "zip",
+            "corrupted.zip": "zip",
+            "valid_multi.zip": "zip-mv",
+            "corrupted_multi.zip": "zip-mv",
+        }
+
     def test_find_archives_mixed_types(self):
         """Test that find_archives() finds both ZIP and 7z archives."""
         if not FIXTURES_DIR.exists():
@@ -168,6 +335,148 @@ class TestArchiveDiscovery:
         assert has_zip or has_7z, "Should find at least ZIP or 7z archives"
 
 
+class TestParallelTesting:
+    """Test suite for testing several archives at once."""
+
+    def test_archives_parallel_matches_sequential(self):
+        """Test that parallel and sequential runs give the same ordered results."""
+        archives = [str(FIXTURES_DIR / name) for name in
+                    ["valid_simple.7z", "valid_simple.zip", "corrupted.7z", "corrupted.zip"]]
+
+        sequential = main.test_archives(archives, jobs=1)
+        parallel = main.test_archives(archives, jobs=2)
+
+        assert parallel == sequential, "Parallel results should match sequential results"
+        assert [archive for archive, _ in parallel] == archives, \
+            "Results should keep the input order"
+        assert [ok for _, ok in parallel] == [True, True, False, False]
+        assert main._seven_zip_path is None, \
+            "Only pool workers should pin the 7z path, not the main process"
+
+    def test_archives_with_7z_batch_output(self, monkeypatch):
+        """Test that test_archives_with_7z() assigns results from one batched 7z run."""
+        stdout = (
+            "Scanning\n\n"
+            "Testing archive: a.7z.001\n--\nPath = a.7z.001\n\nEverything is Ok\n\n"
+            "Testing archive: b.zip\n--\nPath = b.zip\n\nSub items Errors: 1\n\n"
+            "Archives with Errors: 1\n"
+        )
+        commands = []
+
+        def fake_run(command, **kwargs):
+            commands.append(command)
+            return subprocess.CompletedProcess(command, 2, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(main, "_seven_zip_path", "7z")
+        monkeypatch.setattr(main.subprocess, "run", fake_run)
+        # c.7z.001 has no section in the output, so it is tested on its own
+        monkeypatch.setattr(main, "test_archive_with_7z", lambda path: path == "c.7z.001")
+
+        results = main.test_archives_with_7z(["a.7z.001", "b.zip", "c.7z.001"])
+
+        assert results == {"a.7z.001": True, "b.zip": False, "c.7z.001": True}
+        assert commands == [["7z", "t", "-an", "-bsp0", "-bse1",
+                             "-ai!a.7z.001", "-ai!b.zip", "-ai!c.7z.001"]], \
+            "All archives should be tested in a single 7z invocation"
+
+    def test_archives_worker_crash(self, monkeypatch):
+        """Test that a crashed worker fails only the archives it was testing."""
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("Crash injection relies on workers inheriting the patched module")
+
+        archives = [str(FIXTURES_DIR / name) for name in
+                    ["valid_simple.7z", "valid_simple.zip", "corrupted.7z", "corrupted.zip"]]
+        test_archive = main.test_archive
+
+        def crashing_test_archive(archive_path, kind=None):
+            if archive_path.endswith("corrupted.7z"):
+                os.kill(os.getpid(), signal.SIGSEGV)
+            return test_archive(archive_path, kind)
+
+        monkeypatch.setattr(main, "test_archive", crashing_test_archive)
+
+        results = main.test_archives(archives, jobs=2)
+
+        assert results == list(zip(archives, [True, True, False, False])), \
+            "Archives in other tasks should keep their real results"
+
+    def test_archives_with_kinds(self):
+        """Test that archive kinds from find_archives() give the same results."""
+        kinds = main.find_archives(str(FIXTURES_DIR))
+        archives = [path for path, kind in sorted(kinds.items())
+                    if kind in ("7z", "zip")]
+
+        assert main.test_archives(archives, jobs=1, kinds=kinds) == \
+            main.test_archives(archives, jobs=1)
+
+    def test_parse_7z_batch_output(self):
+        """Test per-archive results parsed from a multi-archive 7z run."""
+        # p7zip 16.02 style output of "7z t -an -bsp0 -bse1 -ai!..." over four archives:
+        # one valid, one that cannot be opened, one with a data error and one with a
+        # warning. test_archives_with_7z_real_batch checks against a real 7z binary.
+        stdout = (FIXTURES_DIR / "7z_batch_output.txt").read_text()
+
+        results = main.parse_7z_batch_output(stdout)
+
+        assert results == {
+            os.path.normpath("tests/fixtures/valid_simple.7z"): True,
+            os.path.normpath("tests/fixtures/not_an_archive.7z"): False,
+            os.path.normpath("tests/fixtures/corrupted.7z"): False,
+            os.path.normpath("tests/fixtures/trailing_data.zip"): False,
+        }
+
+    def test_archives_with_7z_real_batch(self):
+        """Test that one batched 7z run tells a valid and a corrupted archive apart."""
+        if not main.is_7z_available():
+            pytest.skip("7z command not available - required for multi-volume archives")
+
+        valid = str(FIXTURES_DIR / "valid_multi.7z.001")
+        corrupted = str(FIXTURES_DIR / "corrupted_multi.7z.001")
+
+        results = main.test_archives_with_7z([valid, corrupted])
+        assert results == {valid: True, corrupted: False}
+
+    def test_split_into_batches(self):
+        """Test that 7z batches are sized to keep every worker busy."""
+        archives = [f"a{i}.7z.001" for i in range(40)]
+
+        assert [len(b) for b in main.split_into_batches(archives[:16], jobs=8)] == [2] * 8
+        assert [len(b) for b in main.split_into_batches(archives, jobs=1)] == [16, 16, 8]
+        assert [len(b) for b in main.split_into_batches(archives[:3], jobs=8)] == [1, 1, 1]
+        assert main.split_into_batches([], jobs=4) == []
+
+
+class TestMain:
+    """Test suite for the command-line entry point."""
+
+    def test_main_progress_without_tqdm(self, monkeypatch, capsys):
+        """Test that main() reports live progress on stderr when tqdm is missing."""
+        monkeypatch.setattr(main, "tqdm", None)
+        monkeypatch.setattr(sys, "argv", ["main.py", str(FIXTURES_DIR), "--jobs", "1"])
+
+        main.main()
+
+        err = capsys.readouterr().err
+        assert "Tested 1/8 archive(s)" in err
+        assert "Tested 8/8 archive(s)" in err
+
+    def test_main_interrupted(self, monkeypatch, capsys):
+        """Test that main() still reports finished archives when interrupted."""
+        def interrupted_results(archives, jobs=1, kinds=None):
+            yield archives[0], False
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(main, "iter_archive_results", interrupted_results)
+        monkeypatch.setattr(sys, "argv", ["main.py", str(FIXTURES_DIR)])
+
+        assert main.main() == 130
+
+        out = capsys.readouterr().out
+        assert "corrupted.7z" in out
+        assert "Failed: 1" in out
+        assert "Not tested (interrupted): 7" in out
+
+
 class TestUtilityFunctions:
     """Test suite for utility functions."""
 
@@ -176,6 +485,57 @@ class TestUtilityFunctions:
         result = main.is_7z_available()
         assert isinstance(result, bool), "is_7z_available() should return a boolean"
 
+    def test_get_7z_command_cached(self, monkeypatch):
+        """Test that get_7z_command() searches PATH only once."""
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return None
+
+        main.get_7z_command.cache_clear()
+        monkeypatch.setattr(main.shutil, "which", fake_which)
+        try:
+            assert main.get_7z_command() is None
+            assert main.is_7z_available() is False
+            assert calls == ["7z", "7z.exe"], "PATH should be searched only on the first call"
+        finally:
+            main.get_7z_command.cache_clear()
+
+    def test_classify_archive_name(self):
+        """Test classify_archive_name() on archive and non-archive file names."""
+        assert main.classify_archive_name("a.zip") == "zip"
+        assert main.classify_archive_name("a.7Z") == "7z"
+        assert main.classify_archive_name("a.7z.001") == "7z-mv"
+        assert main.classify_archive_name("a.7z.002") is None
+        assert main.classify_archive_name("a.001") is None
+        assert main.classify_archive_name("a.z05") == "zip-volume"
+        assert main.classify_archive_name("a.zip.txt") is None
+
+    def test_get_archive_tester(self):
+        """Test that get_archive_tester() dispatches on the file extension."""
+        assert main.get_archive_tester("a/b.ZIP") is main.test_zip_archive
+        assert main.get_archive_tester("a/b.7z") is main.test_7z_archive
+        assert main.get_archive_tester("a/b.7z.001") is main.test_multivolume_archive
+        assert main.get_archive_tester("a/b.z07") is main.test_multivolume_archive
+        assert main.get_archive_tester("a/b.tar") is main.test_unknown_archive
+        assert main.get_archive_tester("a/b.001") is main.test_unknown_archive
+        assert main.get_archive_tester("a/b.zip.001") is main.test_unknown_archive
+        assert main.get_archive_tester("a/b.z00") is main.test_unknown_archive
+        assert main.classify_archive_name("b.z00") is None
+
+    def test_has_zip_volumes_case_insensitive(self, tmp_path):
+        """Test has_zip_volumes() matches volume names regardless of case."""
+        (tmp_path / "Backup.ZIP").write_bytes(b"")
+        (tmp_path / "backup.Z01").write_bytes(b"")
+
+        assert main.has_zip_volumes(str(tmp_path / "Backup.ZIP")) is True
+
+    def test_has_zip_volumes(self):
+        """Test has_zip_volumes() detects .zNN volumes next to a ZIP file."""
+        assert main.has_zip_volumes(str(FIXTURES_DIR / "valid_multi.zip")) is True
+        assert main.has_zip_volumes(str(FIXTURES_DIR / "valid_simple.zip")) is False
+
     def test_get_7z_command(self):
         """Test get_7z_command() function."""
         result = main.get_7z_command()